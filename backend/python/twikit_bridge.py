@@ -2,15 +2,62 @@
 """
 Twikit Bridge - Python service for Twitter scraping via twikit library.
 Communicates with Node.js via stdin/stdout JSON-RPC protocol.
+
+Messages are newline-delimited by default. With TWIKIT_BRIDGE_FRAMING=length
+every message in both directions is prefixed with its byte length as a
+4-byte little-endian integer instead.
 """
 
+import os
 import sys
+import stat
 import json
 import asyncio
 import traceback
-from typing import Optional, List, Dict, Any
+import types
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple, Iterable, Iterator, Union
+from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+# Message framing on stdin/stdout, must match the Node side
+LENGTH_PREFIXED = os.environ.get('TWIKIT_BRIDGE_FRAMING', 'newline') == 'length'
+
+# Message terminator - framed messages carry their length and need none
+_EOL = b"" if LENGTH_PREFIXED else b"\n"
+
+# JSON codec - orjson when available, stdlib otherwise. _dumps returns a
+# complete message, _EOL included, ready to be written to stdout.
+if orjson is not None:
+    _loads = orjson.loads
+    _DUMP_OPTS = 0 if LENGTH_PREFIXED else orjson.OPT_APPEND_NEWLINE
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_DUMP_OPTS)
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8') + _EOL
+
+
+def _write_line(writer: Any, line: bytes) -> None:
+    """Write an encoded message, framed according to LENGTH_PREFIXED."""
+    if LENGTH_PREFIXED:
+        writer.write(len(line).to_bytes(4, 'little'))
+    writer.write(line)
+
+
 try:
     from twikit import Client
     # twikit 2.x uses TwitterException instead of TwikitException
@@ -19,23 +66,226 @@ try:
     except ImportError:
         from twikit.errors import TwikitException
 except ImportError as e:
-    print(json.dumps({
+    _write_line(sys.stdout.buffer, _dumps({
         "jsonrpc": "2.0",
         "error": {"code": -32001, "message": f"twikit not installed or import error: {str(e)}. Run: pip install twikit"},
         "id": None
-    }), flush=True)
+    }))
+    sys.stdout.buffer.flush()
     sys.exit(1)
 
 
+# Tracebacks are only attached to error responses when debugging, as
+# formatting them walks the whole stack on every failed request
+DEBUG = os.environ.get('TWIKIT_BRIDGE_DEBUG') == '1'
+
+
+def _with_traceback(error: Dict[str, Any], key: str = "traceback") -> Dict[str, Any]:
+    """Attach the current traceback to an error dict when DEBUG is on."""
+    if DEBUG:
+        error[key] = traceback.format_exc()
+    return error
+
+
+# Twitter timestamps look like 'Wed Oct 10 20:19:24 +0000 2018'
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
+    'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
+
+def _parse_twitter_ts(s: str) -> str:
+    """Convert a Twitter timestamp to ISO 8601 without going through strptime."""
+    # The format is fixed width, so the fields can be sliced out directly
+    month = _MONTHS.get(s[4:7])
+    digits = s[8:10] + s[11:13] + s[14:16] + s[17:19] + s[21:25] + s[26:30]
+    if (
+        month is None or len(s) != 30 or s[20] not in '+-'
+        or s[13] != ':' or s[16] != ':'
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        raise ValueError(f"Unexpected timestamp format: {s}")
+    return s[26:30] + '-' + month + '-' + s[8:10] + 'T' + s[11:19] + s[20:23] + ':' + s[23:25]
+
+
+def _tweet_images(tweet: Any) -> List[str]:
+    """Extract media URLs from a tweet."""
+    media_urls = []
+    media = tweet.media
+    if media:
+        for item in media:
+            if hasattr(item, 'media_url_https'):
+                media_urls.append(item.media_url_https)
+    return media_urls
+
+
+def _tweet_timestamp(tweet: Any, now_iso: str) -> str:
+    """Return the tweet creation time as an ISO 8601 string, or now_iso if it is unknown."""
+    created_at = tweet.created_at
+    if created_at:
+        try:
+            return _parse_twitter_ts(created_at)
+        except (ValueError, TypeError):
+            try:
+                return datetime.strptime(created_at, '%a %b %d %H:%M:%S %z %Y').isoformat()
+            except (ValueError, TypeError):
+                return now_iso
+    return now_iso
+
+
+def _tweet_id(tweet: Any) -> str:
+    """Return the tweet id as a string."""
+    # twikit 2.x has no id_str, the id property is already a string
+    return tweet.id
+
+
+def _tweet_author(tweet: Any) -> Tuple[str, str]:
+    """Return the (name, username) pair of the tweet author."""
+    user = tweet.user
+    if user:
+        return user.name, user.screen_name
+    return 'Unknown', 'unknown'
+
+
+# Per-field extractors used when the caller asks for a subset of fields.
+# twikit 2.x exposes tweet fields as properties over the raw payload,
+# they never live in tweet.__dict__ and have to be read as attributes.
+# Only user, created_at, media and view_count can legitimately be empty.
+# Each extractor takes the tweet and the fallback timestamp of the search.
+FIELD_EXTRACTORS: Dict[str, Callable[[Any, str], Any]] = {
+    "id": lambda t, now: _tweet_id(t),
+    "text": lambda t, now: t.full_text,
+    "author": lambda t, now: _tweet_author(t)[0],
+    "username": lambda t, now: _tweet_author(t)[1],
+    "timestamp": _tweet_timestamp,
+    "url": lambda t, now: "https://twitter.com/" + _tweet_author(t)[1] + "/status/" + _tweet_id(t),
+    "likes": lambda t, now: t.favorite_count,
+    "retweets": lambda t, now: t.retweet_count,
+    "replies": lambda t, now: t.reply_count,
+    "views": lambda t, now: t.view_count or 0,
+    "images": lambda t, now: _tweet_images(t),
+    "platform": lambda t, now: "twitter",
+}
+
+DEFAULT_FIELDS = tuple(FIELD_EXTRACTORS)
+
+# Full tweet records are copies of this template with the per-tweet fields
+# filled in. Copying a ready-made dict is cheaper than building a 12 key
+# literal, and the constant platform field never has to be set.
+_TWEET_TEMPLATE: Dict[str, Any] = dict.fromkeys(DEFAULT_FIELDS)
+_TWEET_TEMPLATE["platform"] = "twitter"
+
+
+def _tweet_to_dict(tweet: Any, now_iso: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Convert a twikit Tweet into the dict sent back to Node."""
+    if fields is not None:
+        return {name: FIELD_EXTRACTORS[name](tweet, now_iso) for name in fields}
+    
+    # Full record - id and author are shared by several fields, so they are
+    # resolved once here instead of going through the extractors
+    tid = _tweet_id(tweet)
+    author_name, author_username = _tweet_author(tweet)
+    
+    tweet_data = _TWEET_TEMPLATE.copy()
+    tweet_data["id"] = tid
+    tweet_data["text"] = tweet.full_text
+    tweet_data["author"] = author_name
+    tweet_data["username"] = author_username
+    tweet_data["timestamp"] = _tweet_timestamp(tweet, now_iso)
+    tweet_data["url"] = "https://twitter.com/" + author_username + "/status/" + tid
+    tweet_data["likes"] = tweet.favorite_count
+    tweet_data["retweets"] = tweet.retweet_count
+    tweet_data["replies"] = tweet.reply_count
+    tweet_data["views"] = tweet.view_count or 0
+    tweet_data["images"] = _tweet_images(tweet)
+    return tweet_data
+
+
+def _iter_tweet_dicts(
+    tweets: Iterable[Any],
+    now_iso: str,
+    fields: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Convert tweets one at a time. A malformed tweet fails the whole search."""
+    for tweet in tweets:
+        yield _tweet_to_dict(tweet, now_iso, fields)
+
+
+def _stream_response(request_id: Any, items: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Wrap streamed items as NDJSON messages, terminated by a 'done' message."""
+    count = 0
+    try:
+        for item in items:
+            count += 1
+            yield {"jsonrpc": "2.0", "id": request_id, "partial": item}
+    except Exception as e:
+        # End the stream with an error so the pending request on the Node side fails
+        yield {
+            "jsonrpc": "2.0",
+            "error": _with_traceback({
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }, "data"),
+            "id": request_id
+        }
+        return
+    yield {"jsonrpc": "2.0", "id": request_id, "done": True, "count": count}
+
+
+# Upper bound on requests handled at once, so a burst of pipelined
+# searches does not run straight into Twitter's rate limits
+try:
+    MAX_CONCURRENT_REQUESTS = max(1, int(os.environ.get('TWIKIT_BRIDGE_CONCURRENCY', '4')))
+except ValueError:
+    MAX_CONCURRENT_REQUESTS = 4
+
+# Pre-encoded ready handshake, it never changes
+_READY = b'{"status":"ready","version":"1.0.0"}' + _EOL
+
+# Returned by search_tweets/get_trending before initialize succeeded. The
+# dict is shared and never mutated; handle_request recognizes it by identity
+# and splices its pre-encoded form into the response instead of encoding it
+NOT_INITIALIZED_RESULT: Dict[str, Any] = {
+    "success": False,
+    "error": "Client not initialized. Call initialize first.",
+    "type": "NOT_INITIALIZED"
+}
+_NOT_INITIALIZED_BYTES = _dumps(NOT_INITIALIZED_RESULT).rstrip(b"\n")
+
+# Largest request accepted. The stdin readers refuse anything bigger
+# before it is buffered
+MAX_REQUEST_SIZE = 1 << 20
+
+
+def _new_parser() -> Optional[Any]:
+    """Create the request parser, or None when requests go through _loads."""
+    # orjson parses small request lines faster than a full simdjson parse,
+    # so simdjson is only used when orjson is missing. The parser is reused
+    # for every request and refuses documents over max_capacity
+    if orjson is None and simdjson is not None:
+        return simdjson.Parser(max_capacity=MAX_REQUEST_SIZE)
+    return None
+
+
+@dataclass(slots=True)
 class TwikitBridge:
     """Bridge class handling Twitter scraping via twikit."""
     
-    def __init__(self):
-        self.client: Optional[Client] = None
-        self.initialized = False
-        self.username: Optional[str] = None
-        self.email: Optional[str] = None
-        self.password: Optional[str] = None
+    client: Optional[Client] = None
+    initialized: bool = False
+    username: Optional[str] = None
+    email: Optional[str] = None
+    password: Optional[str] = field(default=None, repr=False)
+    _parser: Optional[Any] = field(default_factory=_new_parser, repr=False)
+    
+    def parse_request(self, line: bytes) -> Dict[str, Any]:
+        """Parse a raw JSON-RPC request line. Raises ValueError on invalid input."""
+        if self._parser is not None:
+            # Requests run concurrently, so the whole document is materialized
+            # up front - a lazy one would keep the parser busy until its
+            # request finished
+            return self._parser.parse(line, recursive=True)
+        return _loads(line)
     
     async def initialize(self, username: str, email: str, password: str) -> Dict[str, Any]:
         """Initialize Twitter client with credentials."""
@@ -44,7 +294,10 @@ class TwikitBridge:
             self.email = email
             self.password = password
             
-            self.client = Client('en-US')
+            # Re-authentication reuses the existing client, keeping its
+            # connection pool and TLS sessions warm
+            if self.client is None:
+                self.client = Client('en-US')
             
             # Attempt login
             await self.client.login(
@@ -68,78 +321,56 @@ class TwikitBridge:
                 "type": "AUTH_ERROR"
             }
         except Exception as e:
-            return {
+            return _with_traceback({
                 "success": False,
                 "error": f"Initialization failed: {str(e)}",
-                "type": "UNKNOWN_ERROR",
-                "traceback": traceback.format_exc()
-            }
+                "type": "UNKNOWN_ERROR"
+            })
     
-    async def search_tweets(self, query: str, count: int = 20) -> Dict[str, Any]:
-        """Search for tweets matching the query."""
+    async def search_tweets(
+        self,
+        query: str,
+        count: int = 20,
+        fields: Optional[List[str]] = None,
+        ndjson: bool = False
+    ) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """Search for tweets matching the query, optionally returning only the given fields.
+        
+        With ndjson=True a generator of tweet dicts is returned instead, so the
+        tweets are converted and written out one by one.
+        """
         if not self.initialized or not self.client:
-            return {
-                "success": False,
-                "error": "Client not initialized. Call initialize first.",
-                "type": "NOT_INITIALIZED"
-            }
+            return NOT_INITIALIZED_RESULT
+        
+        if fields is not None:
+            if not isinstance(fields, list) or not all(isinstance(name, str) for name in fields):
+                return {
+                    "success": False,
+                    "error": "fields must be a list of field names",
+                    "type": "INVALID_FIELDS"
+                }
+            unknown = [name for name in fields if name not in FIELD_EXTRACTORS]
+            if unknown:
+                return {
+                    "success": False,
+                    "error": f"Unknown fields: {', '.join(unknown)}",
+                    "type": "INVALID_FIELDS"
+                }
+            # An empty projection means the default full record
+            fields = fields or None
+        
+        # Fallback timestamp for tweets without a usable created_at,
+        # read once per search rather than once per tweet
+        now_iso = datetime.now().isoformat()
         
         try:
             # Search tweets
             tweets = await self.client.search_tweet(query, product='Latest', count=count)
             
-            results = []
+            if ndjson:
+                return _iter_tweet_dicts(tweets, now_iso, fields)
             
-            for tweet in tweets:
-                try:
-                    # Extract media URLs
-                    media_urls = []
-                    if hasattr(tweet, 'media') and tweet.media:
-                        for media in tweet.media:
-                            if hasattr(media, 'media_url_https'):
-                                media_urls.append(media.media_url_https)
-                    
-                    # Extract metrics
-                    like_count = getattr(tweet, 'favorite_count', 0) or 0
-                    retweet_count = getattr(tweet, 'retweet_count', 0) or 0
-                    reply_count = getattr(tweet, 'reply_count', 0) or 0
-                    view_count = getattr(tweet, 'view_count', 0) or 0
-                    
-                    # Parse timestamp
-                    created_at = getattr(tweet, 'created_at', None)
-                    if created_at:
-                        try:
-                            timestamp = datetime.strptime(created_at, '%a %b %d %H:%M:%S %z %Y').isoformat()
-                        except:
-                            timestamp = datetime.now().isoformat()
-                    else:
-                        timestamp = datetime.now().isoformat()
-                    
-                    # Extract user info
-                    user = getattr(tweet, 'user', None)
-                    author_name = getattr(user, 'name', 'Unknown') if user else 'Unknown'
-                    author_username = getattr(user, 'screen_name', 'unknown') if user else 'unknown'
-                    
-                    tweet_data = {
-                        "id": getattr(tweet, 'id_str', str(getattr(tweet, 'id', ''))),
-                        "text": getattr(tweet, 'full_text', getattr(tweet, 'text', '')),
-                        "author": author_name,
-                        "username": author_username,
-                        "timestamp": timestamp,
-                        "url": f"https://twitter.com/{author_username}/status/{getattr(tweet, 'id_str', '')}",
-                        "likes": like_count,
-                        "retweets": retweet_count,
-                        "replies": reply_count,
-                        "views": view_count,
-                        "images": media_urls,
-                        "platform": "twitter"
-                    }
-                    
-                    results.append(tweet_data)
-                    
-                except Exception as e:
-                    # Skip tweets that fail to parse
-                    continue
+            results = list(_iter_tweet_dicts(tweets, now_iso, fields))
             
             return {
                 "success": True,
@@ -155,41 +386,32 @@ class TwikitBridge:
                 "type": "API_ERROR"
             }
         except Exception as e:
-            return {
+            return _with_traceback({
                 "success": False,
                 "error": f"Search failed: {str(e)}",
-                "type": "UNKNOWN_ERROR",
-                "traceback": traceback.format_exc()
-            }
+                "type": "UNKNOWN_ERROR"
+            })
     
     async def get_trending(self, count: int = 20) -> Dict[str, Any]:
         """Get trending tweets."""
         if not self.initialized or not self.client:
-            return {
-                "success": False,
-                "error": "Client not initialized. Call initialize first.",
-                "type": "NOT_INITIALIZED"
-            }
+            return NOT_INITIALIZED_RESULT
         
         try:
             # Get trending topics
             trends = await self.client.get_trends('trending')
             
-            results = []
-            
-            for trend in trends[:min(count, len(trends))]:
-                try:
-                    trend_data = {
-                        "name": getattr(trend, 'name', ''),
-                        "url": getattr(trend, 'url', ''),
-                        "tweet_volume": getattr(trend, 'tweet_volume', None),
-                        "platform": "twitter"
-                    }
-                    
-                    results.append(trend_data)
-                    
-                except Exception as e:
-                    continue
+            # Trend objects always carry a name; twikit 2.x Trends have no url
+            # or tweet_volume, so those two still fall back to defaults
+            results = [
+                {
+                    "name": trend.name,
+                    "url": getattr(trend, 'url', ''),
+                    "tweet_volume": getattr(trend, 'tweet_volume', None),
+                    "platform": "twitter"
+                }
+                for trend in trends[:count]
+            ]
             
             return {
                 "success": True,
@@ -204,43 +426,65 @@ class TwikitBridge:
                 "type": "API_ERROR"
             }
         except Exception as e:
-            return {
+            return _with_traceback({
                 "success": False,
                 "error": f"Trending fetch failed: {str(e)}",
-                "type": "UNKNOWN_ERROR",
-                "traceback": traceback.format_exc()
-            }
+                "type": "UNKNOWN_ERROR"
+            })
+
+
+# JSON-RPC method name -> handler(bridge, params)
+DISPATCH: Dict[str, Callable[[TwikitBridge, Dict[str, Any]], Awaitable[Any]]] = {
+    'initialize': lambda bridge, params: bridge.initialize(
+        username=params.get('username'),
+        email=params.get('email'),
+        password=params.get('password')
+    ),
+    'search': lambda bridge, params: bridge.search_tweets(
+        query=params.get('query'),
+        count=params.get('count', 20),
+        fields=params.get('fields'),
+        ndjson=bool(params.get('ndjson', False))
+    ),
+    'trending': lambda bridge, params: bridge.get_trending(
+        count=params.get('count', 20)
+    ),
+}
 
 
-async def handle_request(bridge: TwikitBridge, request: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle incoming JSON-RPC request."""
+async def handle_request(
+    bridge: TwikitBridge,
+    request: Dict[str, Any]
+) -> Union[Dict[str, Any], Iterator[Dict[str, Any]], bytes]:
+    """Handle incoming JSON-RPC request.
+    
+    Streamed results come back as a generator of messages and constant
+    responses as an already encoded bytes line.
+    """
     method = request.get('method')
     params = request.get('params', {})
     request_id = request.get('id')
     
     try:
-        if method == 'initialize':
-            result = await bridge.initialize(
-                username=params.get('username'),
-                email=params.get('email'),
-                password=params.get('password')
-            )
-        elif method == 'search':
-            result = await bridge.search_tweets(
-                query=params.get('query'),
-                count=params.get('count', 20)
-            )
-        elif method == 'trending':
-            result = await bridge.get_trending(
-                count=params.get('count', 20)
-            )
-        else:
+        handler = DISPATCH.get(method)
+        if handler is None:
             return {
                 "jsonrpc": "2.0",
                 "error": {"code": -32601, "message": f"Method not found: {method}"},
                 "id": request_id
             }
         
+        result = await handler(bridge, params)
+        
+        if result is NOT_INITIALIZED_RESULT:
+            return (
+                b'{"jsonrpc":"2.0","result":' + _NOT_INITIALIZED_BYTES
+                + b',"id":' + _dumps(request_id).rstrip(b"\n") + b'}' + _EOL
+            )
+        
+        if isinstance(result, types.GeneratorType):
+            return _stream_response(request_id, result)
+        
         return {
             "jsonrpc": "2.0",
             "result": result,
@@ -250,78 +494,247 @@ async def handle_request(bridge: TwikitBridge, request: Dict[str, Any]) -> Dict[
     except Exception as e:
         return {
             "jsonrpc": "2.0",
-            "error": {
+            "error": _with_traceback({
                 "code": -32603,
-                "message": f"Internal error: {str(e)}",
-                "data": traceback.format_exc()
-            },
+                "message": f"Internal error: {str(e)}"
+            }, "data"),
             "id": request_id
         }
 
 
+class BlockingStdio:
+    """Blocking stdin/stdout with the StreamReader/StreamWriter calls main() uses.
+    
+    Fallback for when stdio cannot be bound to asyncio pipe transports, e.g.
+    on Windows or when stdio is redirected to a file or /dev/null.
+    """
+    
+    async def readuntil(self, separator: bytes = b"\n") -> bytes:
+        loop = asyncio.get_running_loop()
+        limit = MAX_REQUEST_SIZE + 1
+        line = await loop.run_in_executor(None, sys.stdin.buffer.readline, limit)
+        if not line.endswith(separator):
+            if len(line) == limit:
+                # Unlike StreamReader the overlong part is already consumed,
+                # so there is nothing left over for the caller to skip
+                raise asyncio.LimitOverrunError("Request line exceeds the limit", 0)
+            raise asyncio.IncompleteReadError(line, None)
+        return line
+    
+    async def readexactly(self, n: int) -> bytes:
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, sys.stdin.buffer.read, n)
+        if len(data) < n:
+            raise asyncio.IncompleteReadError(data, n)
+        return data
+    
+    def write(self, data: bytes) -> None:
+        sys.stdout.buffer.write(data)
+    
+    async def drain(self) -> None:
+        sys.stdout.buffer.flush()
+
+
+def _is_pipe(stream: Any) -> bool:
+    """Check whether a std stream is a pipe or socket asyncio can watch."""
+    # Windows std handles are not opened for overlapped I/O, which the
+    # proactor pipe transports require
+    if sys.platform == 'win32':
+        return False
+    try:
+        mode = os.fstat(stream.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    # Character devices like /dev/null are accepted by connect_*_pipe but
+    # cannot be registered with epoll, so they are left to the fallback
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+
+async def open_stdio() -> Tuple[Any, Any]:
+    """Bind stdin/stdout to asyncio streams, falling back to blocking stdio."""
+    loop = asyncio.get_running_loop()
+    fallback = BlockingStdio()
+    
+    reader = writer = fallback
+    
+    if _is_pipe(sys.stdin):
+        try:
+            # One byte of headroom for the newline terminating the request
+            reader = asyncio.StreamReader(limit=MAX_REQUEST_SIZE + 1)
+            protocol = asyncio.StreamReaderProtocol(reader)
+            await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        except (ValueError, OSError, NotImplementedError):
+            reader = fallback
+    
+    if _is_pipe(sys.stdout):
+        try:
+            transport, write_protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+            # With no buffer allowance drain() returns only once the data reached the pipe
+            transport.set_write_buffer_limits(0)
+            writer = asyncio.StreamWriter(transport, write_protocol, None, loop)
+        except (ValueError, OSError, NotImplementedError):
+            writer = fallback
+    
+    return reader, writer
+
+
+class FramingError(Exception):
+    """A length-prefixed frame header that cannot be valid.
+    
+    There is no way to find the next frame boundary after it, so the
+    bridge exits and lets the Node side restart it.
+    """
+
+
+async def _skip_line(reader: Any) -> None:
+    """Discard input up to and including the next newline."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+async def _read_message(reader: Any) -> Optional[bytes]:
+    """Read the next request payload from stdin, or None at EOF.
+    
+    Raises ValueError for a request line over MAX_REQUEST_SIZE, after
+    skipping the rest of it, and FramingError for a frame over it.
+    """
+    if not LENGTH_PREFIXED:
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # Last line without a trailing newline
+            return e.partial or None
+        except asyncio.LimitOverrunError:
+            await _skip_line(reader)
+            raise ValueError(f"Request exceeds {MAX_REQUEST_SIZE} bytes")
+    
+    try:
+        header = await reader.readexactly(4)
+        size = int.from_bytes(header, 'little')
+        if size > MAX_REQUEST_SIZE:
+            raise FramingError(f"Frame length {size} exceeds {MAX_REQUEST_SIZE} bytes")
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+async def _write(writer: Any, message: Dict[str, Any]) -> None:
+    """Write a single JSON-RPC message line to stdout."""
+    _write_line(writer, _dumps(message))
+    await writer.drain()
+
+
+async def process_request(
+    bridge: TwikitBridge,
+    request: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    writer: Any
+) -> None:
+    """Handle a single request and write its response as soon as it is ready."""
+    try:
+        async with semaphore:
+            response = await handle_request(bridge, request)
+    except Exception as e:
+        response = {
+            "jsonrpc": "2.0",
+            "error": _with_traceback({
+                "code": -32603,
+                "message": f"Server error: {str(e)}"
+            }, "data"),
+            "id": None
+        }
+    
+    # Responses are matched by id on the Node side, so they may go out of order
+    if isinstance(response, types.GeneratorType):
+        for message in response:
+            await _write(writer, message)
+        return
+    
+    # Pre-encoded response line
+    if isinstance(response, bytes):
+        _write_line(writer, response)
+        await writer.drain()
+        return
+    
+    await _write(writer, response)
+
+
 async def main():
-    """Main event loop - read from stdin, process requests, write to stdout."""
+    """Main event loop - read from stdin, dispatch requests concurrently, write to stdout."""
     bridge = TwikitBridge()
     
-    # Send ready signal
-    print(json.dumps({"status": "ready", "version": "1.0.0"}), flush=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    pending = set()
+    
+    reader, writer = await open_stdio()
     
-    # Process requests from stdin
-    loop = asyncio.get_event_loop()
+    # Send ready signal
+    _write_line(writer, _READY)
+    await writer.drain()
     
     while True:
         try:
-            # Read line from stdin (blocking)
-            line = await loop.run_in_executor(None, sys.stdin.readline)
-            
-            if not line:
-                # EOF reached, exit gracefully
-                break
-            
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Parse JSON-RPC request
+            # Read and parse JSON-RPC request
             try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
+                line = await _read_message(reader)
+                
+                if line is None:
+                    # EOF reached, exit gracefully
+                    break
+                
+                line = line.strip()
+                if not line:
+                    continue
+                
+                request = bridge.parse_request(line)
+            except ValueError as e:
                 response = {
                     "jsonrpc": "2.0",
                     "error": {"code": -32700, "message": f"Parse error: {str(e)}"},
                     "id": None
                 }
-                print(json.dumps(response), flush=True)
+                await _write(writer, response)
                 continue
             
-            # Handle request
-            response = await handle_request(bridge, request)
-            
-            # Send response
-            print(json.dumps(response), flush=True)
+            # Handle request without waiting for the previous ones to finish
+            task = asyncio.create_task(process_request(bridge, request, semaphore, writer))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
             
         except KeyboardInterrupt:
             break
+        except FramingError:
+            raise
         except Exception as e:
             error_response = {
                 "jsonrpc": "2.0",
-                "error": {
+                "error": _with_traceback({
                     "code": -32603,
-                    "message": f"Server error: {str(e)}",
-                    "data": traceback.format_exc()
-                },
+                    "message": f"Server error: {str(e)}"
+                }, "data"),
                 "id": None
             }
-            print(json.dumps(error_response), flush=True)
+            await _write(writer, error_response)
+    
+    # Let in-flight requests write their responses before exiting
+    if pending:
+        await asyncio.gather(*pending)
 
 
 if __name__ == '__main__':
     try:
         asyncio.run(main())
     except Exception as e:
-        print(json.dumps({
+        _write_line(sys.stdout.buffer, _dumps({
             "status": "error",
             "message": str(e),
             "traceback": traceback.format_exc()
-        }), flush=True)
+        }))
+        sys.stdout.buffer.flush()
         sys.exit(1)
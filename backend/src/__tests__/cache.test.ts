@@ -2,7 +2,7 @@
  * Cache service tests
  */
 
-import { CacheService } from '../src/services/cacheService';
+import { CacheService } from '../services/cacheService';
 
 describe('CacheService', () => {
   let cache: CacheService;
@@ -3,8 +3,8 @@
  * Run with: npm test
  */
 
-import { TwikitScraper } from '../src/services/twikitScraper';
-import { getPythonBridge, cleanupPythonBridge } from '../src/services/pythonBridge';
+import { TwikitScraper } from '../services/twikitScraper';
+import { PythonBridge, getPythonBridge, cleanupPythonBridge } from '../services/pythonBridge';
 
 describe('TwikitScraper Integration', () => {
   let scraper: TwikitScraper | null = null;
@@ -85,3 +85,138 @@ describe('PythonBridge', () => {
     expect(bridge.getIsInitialized()).toBe(false);
   });
 });
+
+/**
+ * Create a bridge wired to a fake process, so the stdout handling can be
+ * driven directly without spawning Python
+ */
+function createFakeBridge(framing: 'newline' | 'length'): any {
+  const bridge: any = new PythonBridge();
+  bridge.framing = framing;
+  bridge.process = { stdin: { write: jest.fn() }, kill: jest.fn() };
+  return bridge;
+}
+
+function frame(message: any): Buffer {
+  const body = Buffer.from(JSON.stringify(message));
+  const header = Buffer.alloc(4);
+  header.writeUInt32LE(body.length, 0);
+  return Buffer.concat([header, body]);
+}
+
+describe('PythonBridge length-prefixed framing', () => {
+  let bridge: any;
+
+  beforeEach(() => {
+    bridge = createFakeBridge('length');
+  });
+
+  afterEach(() => {
+    bridge.cleanup();
+  });
+
+  it('should write requests with a length prefix', () => {
+    bridge.sendRequest('trending', { count: 1 }).catch(() => {});
+
+    const written: Buffer = bridge.process.stdin.write.mock.calls[0][0];
+    const body = written.subarray(4).toString();
+
+    expect(written.readUInt32LE(0)).toBe(Buffer.byteLength(body));
+    expect(JSON.parse(body)).toMatchObject({ method: 'trending', params: { count: 1 } });
+  });
+
+  it('should reassemble a frame split across chunks', async () => {
+    const pending = bridge.sendRequest('trending', { count: 1 });
+    const data = frame({ jsonrpc: '2.0', result: { success: true, trends: [] }, id: 1 });
+
+    // Split inside the header and inside the body
+    bridge.handleStdout(data.subarray(0, 2));
+    bridge.handleStdout(data.subarray(2, 10));
+    bridge.handleStdout(data.subarray(10));
+
+    await expect(pending).resolves.toEqual({ success: true, trends: [] });
+  });
+
+  it('should handle several frames in one chunk', async () => {
+    const first = bridge.sendRequest('trending', { count: 1 });
+    const second = bridge.sendRequest('trending', { count: 2 });
+
+    bridge.handleStdout(Buffer.concat([
+      frame({ status: 'ready', version: '1.0.0' }),
+      frame({ jsonrpc: '2.0', result: { n: 2 }, id: 2 }),
+      frame({ jsonrpc: '2.0', result: { n: 1 }, id: 1 })
+    ]));
+
+    expect(bridge.getIsReady()).toBe(true);
+    await expect(first).resolves.toEqual({ n: 1 });
+    await expect(second).resolves.toEqual({ n: 2 });
+  });
+
+  it('should decode multi-byte UTF-8 split across chunks', async () => {
+    const text = 'zażółć gęślą jaźń 🚀';
+    const pending = bridge.sendRequest('search', { query: text });
+    const data = frame({ jsonrpc: '2.0', result: { query: text }, id: 1 });
+
+    // Cut in the middle of the 4-byte emoji
+    const cut = data.length - 12;
+    bridge.handleStdout(data.subarray(0, cut));
+    bridge.handleStdout(data.subarray(cut));
+
+    await expect(pending).resolves.toEqual({ query: text });
+  });
+});
+
+describe('PythonBridge NDJSON streaming', () => {
+  let bridge: any;
+
+  beforeEach(() => {
+    bridge = createFakeBridge('newline');
+  });
+
+  afterEach(() => {
+    bridge.cleanup();
+  });
+
+  function send(...messages: any[]): void {
+    bridge.handleStdout(Buffer.from(messages.map((m) => JSON.stringify(m) + '\n').join('')));
+  }
+
+  it('should collect partials and resolve on done', async () => {
+    const partials: any[] = [];
+    bridge.on('partial', (id: number, item: any) => partials.push([id, item]));
+
+    const pending = bridge.sendRequest('search', { query: 'AI', count: 2, ndjson: true });
+    send(
+      { jsonrpc: '2.0', id: 1, partial: { id: '1' } },
+      { jsonrpc: '2.0', id: 1, partial: { id: '2' } },
+      { jsonrpc: '2.0', id: 1, done: true, count: 2 }
+    );
+
+    // Same shape as the non-streamed search result
+    await expect(pending).resolves.toEqual({
+      success: true,
+      tweets: [{ id: '1' }, { id: '2' }],
+      count: 2,
+      query: 'AI'
+    });
+    expect(partials).toEqual([[1, { id: '1' }], [1, { id: '2' }]]);
+  });
+
+  it('should resolve an empty stream', async () => {
+    const pending = bridge.sendRequest('search', { query: 'AI', ndjson: true });
+    send({ jsonrpc: '2.0', id: 1, done: true, count: 0 });
+
+    await expect(pending).resolves.toEqual({ success: true, tweets: [], count: 0, query: 'AI' });
+  });
+
+  it('should reject a stream that ends in an error', async () => {
+    const pending = bridge.sendRequest('search', { query: 'AI', ndjson: true });
+    send(
+      { jsonrpc: '2.0', id: 1, partial: { id: '1' } },
+      { jsonrpc: '2.0', id: 1, error: { code: -32603, message: 'Internal error: bad tweet' } }
+    );
+
+    await expect(pending).rejects.toThrow('Internal error: bad tweet');
+    expect(bridge.pendingRequests.size).toBe(0);
+  });
+});
@@ -23,6 +23,10 @@ interface JsonRpcResponse {
     message: string;
     data?: any;
   };
+  // NDJSON streaming: one `partial` message per item, then a `done` terminator
+  partial?: any;
+  done?: boolean;
+  count?: number;
   id: number;
 }
 
@@ -30,6 +34,8 @@ interface PendingRequest {
   resolve: (value: any) => void;
   reject: (error: Error) => void;
   timeout: NodeJS.Timeout;
+  params?: any;
+  partials?: any[];
 }
 
 export class PythonBridge extends EventEmitter {
@@ -39,6 +45,9 @@ export class PythonBridge extends EventEmitter {
   private isReady = false;
   private isInitialized = false;
   private buffer = '';
+  private frameBuffer: Buffer = Buffer.alloc(0);
+  // Message framing on stdin/stdout: newline-delimited, or a 4-byte little-endian length prefix
+  private framing: 'newline' | 'length' = process.env.TWIKIT_BRIDGE_FRAMING === 'length' ? 'length' : 'newline';
   private restartAttempts = 0;
   private maxRestartAttempts = 3;
   private defaultTimeout = 60000; // 60 seconds - Twitter login can be slow
@@ -93,7 +102,7 @@ export class PythonBridge extends EventEmitter {
         // Spawn Python process
         this.process = spawn(this.pythonPath, [this.scriptPath], {
           stdio: ['pipe', 'pipe', 'pipe'],
-          env: { ...process.env }
+          env: { ...process.env, TWIKIT_BRIDGE_FRAMING: this.framing }
         });
 
         // Handle stdout (responses from Python)
@@ -166,13 +175,24 @@ export class PythonBridge extends EventEmitter {
 
   /**
    * Search for tweets
+   * Pass `fields` to receive only a subset of each tweet's fields (e.g. ['id', 'text', 'likes'])
+   * With `ndjson` tweets are streamed one per line and emitted as 'partial' events as they arrive;
+   * the returned promise still resolves with the full result once the stream is done
    */
-  async search(query: string, count: number = 20): Promise<any> {
+  async search(query: string, count: number = 20, fields?: string[], ndjson: boolean = false): Promise<any> {
     if (!this.isInitialized) {
       throw new Error('Twitter client not initialized. Call initialize() first.');
     }
 
-    return this.sendRequest('search', { query, count });
+    const params: any = { query, count };
+    if (fields) {
+      params.fields = fields;
+    }
+    if (ndjson) {
+      params.ndjson = true;
+    }
+
+    return this.sendRequest('search', params);
   }
 
   /**
@@ -221,13 +241,21 @@ export class PythonBridge extends EventEmitter {
           clearTimeout(timeoutHandle);
           reject(error);
         },
-        timeout: timeoutHandle
+        timeout: timeoutHandle,
+        params
       });
 
       // Send request
       try {
-        const requestStr = JSON.stringify(request) + '\n';
-        this.process.stdin.write(requestStr);
+        if (this.framing === 'length') {
+          const body = Buffer.from(JSON.stringify(request));
+          const header = Buffer.alloc(4);
+          header.writeUInt32LE(body.length, 0);
+          this.process.stdin.write(Buffer.concat([header, body]));
+        } else {
+          const requestStr = JSON.stringify(request) + '\n';
+          this.process.stdin.write(requestStr);
+        }
       } catch (error) {
         this.pendingRequests.delete(id);
         clearTimeout(timeoutHandle);
@@ -240,6 +268,11 @@ export class PythonBridge extends EventEmitter {
    * Handle stdout data from Python process
    */
   private handleStdout(data: Buffer): void {
+    if (this.framing === 'length') {
+      this.handleFramedStdout(data);
+      return;
+    }
+
     this.buffer += data.toString();
 
     // Process complete lines
@@ -249,13 +282,40 @@ export class PythonBridge extends EventEmitter {
       this.buffer = this.buffer.substring(newlineIndex + 1);
 
       if (line) {
-        try {
-          const message = JSON.parse(line);
-          this.handleMessage(message);
-        } catch (error) {
-          console.error('[PythonBridge] Failed to parse message:', line);
-        }
+        this.handleRawMessage(line);
+      }
+    }
+  }
+
+  /**
+   * Handle length-prefixed stdout data from Python process
+   */
+  private handleFramedStdout(data: Buffer): void {
+    this.frameBuffer = Buffer.concat([this.frameBuffer, data]);
+
+    // Process complete frames
+    while (this.frameBuffer.length >= 4) {
+      const length = this.frameBuffer.readUInt32LE(0);
+      if (this.frameBuffer.length < 4 + length) {
+        break;
       }
+
+      const payload = this.frameBuffer.subarray(4, 4 + length).toString();
+      this.frameBuffer = this.frameBuffer.subarray(4 + length);
+
+      this.handleRawMessage(payload);
+    }
+  }
+
+  /**
+   * Parse a single message received from Python
+   */
+  private handleRawMessage(raw: string): void {
+    try {
+      const message = JSON.parse(raw);
+      this.handleMessage(message);
+    } catch (error) {
+      console.error('[PythonBridge] Failed to parse message:', raw);
     }
   }
 
@@ -279,6 +339,24 @@ export class PythonBridge extends EventEmitter {
     // Handle JSON-RPC response
     if (message.jsonrpc === '2.0' && message.id !== undefined) {
       const pending = this.pendingRequests.get(message.id);
+
+      // Streamed item - collect it until the terminator arrives
+      if (pending && message.partial !== undefined) {
+        if (!pending.partials) {
+          pending.partials = [];
+        }
+        pending.partials.push(message.partial);
+        this.emit('partial', message.id, message.partial);
+        return;
+      }
+
+      if (pending && message.done) {
+        this.pendingRequests.delete(message.id);
+        const tweets = pending.partials || [];
+        pending.resolve({ success: true, tweets, count: tweets.length, query: pending.params?.query });
+        return;
+      }
+
       if (pending) {
         this.pendingRequests.delete(message.id);
 
@@ -298,6 +376,8 @@ export class PythonBridge extends EventEmitter {
     this.isReady = false;
     this.isInitialized = false;
     this.process = null;
+    this.buffer = '';
+    this.frameBuffer = Buffer.alloc(0);
 
     // Reject all pending requests
     for (const [id, pending] of this.pendingRequests.entries()) {